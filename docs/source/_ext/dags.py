@@ -19,6 +19,7 @@ Furthermore, there are multiple options to configure the daigram's output format
     * hide_diagram: whether to omit rendering the Graphiz diagram; defaults to False
     * hide_tasks: whether to exclude the list of tasks; defaults to False
     * hide_schedule: whether to exclude the schedule; defaults to False
+    * compact_diagram: whether to prune pass-through dummy tasks from the diagram; defaults to False
     * title: diagram title (shown on top); defaults to None
     * caption: diagram caption (shown underneath diagram); defaults to None
 
@@ -27,30 +28,37 @@ Usage with options looks like::
     .. autodag:: dags.dag_name
         :hide_tasks:
 
-.. seealso::
+.. note::
 
-    `Graphviz extension <https://www.sphinx-doc.org/en/master/usage/extensions/graphviz.html>`_
-    documentation for configuring the DAG diagrams; for example, add the following lines to conf.py to orient i
-    graphs top to bottom and render them as SVG (instead of PNG)::
-
-        graphviz_dot_args = ['-Grankdir="TB"']
-        graphviz_output_format = 'svg'
+    Diagrams are pre-rendered to SVG at documentation-generation time, so the Graphviz ``dot``
+    executable must be available on the PATH when building the docs.
 
 """
+import functools
+import hashlib
 import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import m2r
-from airflow import DAG
-from airflow.models import BaseOperator
-from airflow.utils.dot_renderer import render_dag
-from cron_descriptor import get_description
+from docutils.statemachine import StringList
+from sphinx.ext.autodoc import bool_option
 from sphinx.ext.autodoc import ClassDocumenter
 from sphinx.ext.autodoc import ModuleDocumenter
-from sphinx.ext.autodoc.importer import get_module_members
 from sphinx.ext.autodoc.importer import import_object
 from sphinx.util import logging
 
+# airflow (which drags in SQLAlchemy and friends) and the markdown/cron helpers
+# are imported lazily at function scope so that merely loading this extension
+# during conf.py evaluation stays cheap; see the imports in scan_module,
+# md_to_rst and describe_cron
+if TYPE_CHECKING:
+    from airflow import DAG
+    from markdown_it.tree import SyntaxTreeNode
+
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +67,367 @@ def qual_name(x):
     return f"{x.__module__}.{type(x).__name__}"
 
 
+# section underline characters by markdown heading level; mirrors the order
+# accepted by :meth:`DagDocumenter.add_title`
+HEADING_CHARS = {1: "#", 2: "*", 3: "=", 4: "-", 5: "^", 6: "~"}
+
+# constructs that only occur in markdown: atx headings, fenced code blocks,
+# [text](url) links and **bold**
+MD_PATTERN = re.compile(r"(^#{1,6} |```|\[[^\]]+\]\([^)]+\)|\*\*[^*]+\*\*)", re.M)
+
+
+def looks_like_markdown(s: str) -> bool:
+    """Guess whether a docstring is written in markdown rather than rst
+
+    Checks for constructs that only occur in markdown (see :data:`MD_PATTERN`),
+    so rst-native docstrings can skip the markdown conversion pass entirely.
+
+    Args:
+        s: docstring to sniff
+
+    Returns:
+        True when the docstring appears to be markdown
+    """
+    return bool(MD_PATTERN.search(s))
+
+
+def render_md_inline(node: "SyntaxTreeNode") -> str:
+    """Render an inline markdown node (and its children) as a line of rst
+
+    Args:
+        node: an ``inline`` node of the markdown syntax tree
+
+    Returns:
+        the rst for the node's text, code spans, emphasis and links
+    """
+    out = []
+    for child in node.children:
+        t = child.type
+        if t == "text":
+            out.append(child.content)
+        elif t == "code_inline":
+            out.append(f"``{child.content}``")
+        elif t == "strong":
+            out.append(f"**{render_md_inline(child)}**")
+        elif t == "em":
+            out.append(f"*{render_md_inline(child)}*")
+        elif t == "link":
+            out.append(f"`{render_md_inline(child)} <{child.attrs.get('href', '')}>`_")
+        elif t in ("softbreak", "hardbreak"):
+            out.append("\n")
+        elif child.children:
+            out.append(render_md_inline(child))
+        else:
+            out.append(child.content)
+
+    return "".join(out)
+
+
+def render_md_block(node: "SyntaxTreeNode", indent: str = "") -> list:
+    """Render a block-level markdown node's children as lines of rst
+
+    Handles the constructs that show up in DAG/task docstrings: headings,
+    paragraphs, fenced code, (nested) lists, blockquotes and tables. Anything
+    unrecognized falls back to its raw text content.
+
+    Args:
+        node: a block-level node of the markdown syntax tree
+        indent: leading whitespace applied to every emitted line
+
+    Returns:
+        lines: list of rst lines (without trailing newlines)
+    """
+    lines = []
+    for child in node.children:
+        t = child.type
+        if t == "heading":
+            text = render_md_inline(child.children[0])
+            lines += [indent + text, indent + HEADING_CHARS[int(child.tag[1])] * len(text), ""]
+        elif t == "paragraph":
+            lines += [indent + l for l in render_md_inline(child.children[0]).split("\n")]
+            lines.append("")
+        elif t in ("fence", "code_block"):
+            lines.append(f"{indent}.. code-block:: {(child.info or '').strip()}".rstrip())
+            lines.append("")
+            lines += [f"{indent}    {l}" for l in child.content.rstrip("\n").split("\n")]
+            lines.append("")
+        elif t in ("bullet_list", "ordered_list"):
+            marker = "* " if t == "bullet_list" else "#. "
+            for item in child.children:
+                item_lines = render_md_block(item, indent + " " * len(marker))
+                if item_lines:
+                    item_lines[0] = indent + marker + item_lines[0].lstrip()
+                lines += item_lines
+            lines.append("")
+        elif t == "blockquote":
+            # the recursive call strips its own trailing blanks, so re-add the
+            # one that ends the block quote before whatever follows
+            lines += render_md_block(child, indent + "    ")
+            lines.append("")
+        elif t == "table":
+            lines += [f"{indent}.. list-table::", f"{indent}    :header-rows: 1", ""]
+            for section in child.children:  # thead, tbody
+                for row in section.children:
+                    for i, cell in enumerate(row.children):
+                        prefix = "* - " if i == 0 else "  - "
+                        lines.append(f"{indent}    {prefix}{render_md_inline(cell.children[0]) if cell.children else ''}")
+            lines.append("")
+        elif t == "hr":
+            lines += [indent + "----", ""]
+        else:
+            lines += [indent + l for l in child.content.rstrip("\n").split("\n")]
+            lines.append("")
+
+    # drop trailing blank lines so callers control spacing
+    while lines and not lines[-1]:
+        lines.pop()
+
+    return lines
+
+
+@functools.lru_cache(maxsize=4096)
+def md_to_rst(md: str) -> str:
+    """Convert a markdown string to rst, memoized
+
+    Markdown is tokenized with :class:`markdown_it.MarkdownIt` (commonmark plus
+    tables) and the token tree is rendered to rst by :func:`render_md_block`.
+    The same ``doc_md`` frequently repeats across (templated) tasks, so
+    identical inputs are only converted once per build.
+
+    Args:
+        md: markdown string
+
+    Returns:
+        the converted rst
+    """
+    from markdown_it import MarkdownIt
+    from markdown_it.tree import SyntaxTreeNode
+
+    tree = SyntaxTreeNode(MarkdownIt("commonmark").enable("table").parse(md))
+
+    return "\n".join(render_md_block(tree))
+
+
+def add_text(documenter, text: str, sn: str) -> None:
+    """Add a multi-line block of rst to a documenter's output in one batch
+
+    :meth:`sphinx.ext.autodoc.Documenter.add_line` appends a single line per
+    call and re-records source info each time; for large docstrings it's much
+    cheaper to extend the underlying :class:`docutils.statemachine.StringList`
+    once.
+
+    Args:
+        documenter: the :class:`sphinx.ext.autodoc.Documenter` being generated
+        text: block of rst, possibly spanning many lines
+        sn: source name, return value of :meth:`get_sourcename`
+    """
+    lines = [documenter.indent + line if line else "" for line in text.splitlines()]
+    documenter.directive.result.extend(StringList(lines, source=sn))
+
+
+# human-readable descriptions for airflow's cron presets, so the (pure Python)
+# cron_descriptor parser is only needed for raw cron strings
+PRESET_DESCRIPTIONS = {
+    "@once": "Once, as soon as possible",
+    "@hourly": "Every hour",
+    "@daily": "Every day at midnight",
+    "@weekly": "Every Sunday at midnight",
+    "@monthly": "Every first day of the month at midnight",
+    "@quarterly": "Every first day of the quarter at midnight",
+    "@yearly": "Every January 1st at midnight",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def describe_cron(expression: str) -> str:
+    """Describe a cron expression in plain english, memoized
+
+    Many DAGs share the same schedule, so each distinct expression only pays
+    for the :func:`cron_descriptor.get_description` parse once per build.
+
+    Args:
+        expression: cron expression
+
+    Returns:
+        human-readable description of the expression
+    """
+    from cron_descriptor import get_description
+
+    return get_description(expression)
+
+
+def add_blank(documenter, sn: str) -> None:
+    """Add a blank separator line to a documenter's output
+
+    Emits an empty string (the rst parser treats ``""`` and ``" "`` the same,
+    and the former stores fewer bytes) and no-ops when the output already ends
+    with a blank line, so adjacent spacer calls don't pile up.
+
+    Args:
+        documenter: the :class:`sphinx.ext.autodoc.Documenter` being generated
+        sn: source name, return value of :meth:`get_sourcename`
+    """
+    result = documenter.directive.result
+    if not len(result) or not result[-1].strip():
+        return
+    documenter.add_line("", sn)
+
+
+def diagram_hash(nodes: list, edges: list, extra=None) -> str:
+    """Compute a stable hash over a diagram's structure
+
+    Hashes the node and edge lists that actually get rendered (see
+    :func:`dag_structure` and :func:`compact_structure`), so the hash changes
+    exactly when the diagram would; cosmetic changes (e.g. a task's docstring)
+    don't invalidate it.
+
+    Args:
+        nodes: task ids emitted as nodes
+        edges: (upstream, downstream) task id pairs emitted as edges
+        extra (optional): anything else baked into the rendered output
+            (e.g. the diagram title and options); defaults to None
+
+    Returns:
+        hexdigest of the diagram's nodes and edges
+    """
+    return hashlib.blake2b(repr((extra, nodes, edges)).encode()).hexdigest()
+
+
+def dag_structure(dag: "DAG") -> tuple:
+    """Compute the DAG's full node and edge lists
+
+    Reads ``task_dict``/``downstream_task_ids`` directly rather than going
+    through airflow's dot_renderer, which also computes per-task colors and
+    styles the diagram doesn't use.
+
+    Args:
+        dag: DAG to walk
+
+    Returns:
+        (nodes, edges): sorted task ids, and sorted (upstream, downstream)
+        task id pairs
+    """
+    nodes = sorted(dag.task_dict)
+    edges = sorted((t.task_id, down) for t in dag.tasks for down in t.downstream_task_ids)
+
+    return nodes, edges
+
+
+def compact_structure(dag: "DAG") -> tuple:
+    """Compute the DAG's nodes and edges with pass-through dummy tasks pruned
+
+    A :class:`airflow.operators.dummy.DummyOperator` with exactly one upstream
+    and one downstream task carries no information in a diagram; dropping it
+    and splicing its edges together shrinks the rendered SVG considerably on
+    DAGs that use dummy fan-in/fan-out hubs.
+
+    Args:
+        dag: DAG to compact
+
+    Returns:
+        (nodes, edges): sorted task ids to keep, and sorted (upstream,
+        downstream) task id pairs with pruned tasks spliced out
+    """
+
+    from airflow.operators.dummy import DummyOperator
+
+    def pass_through(t):
+        return isinstance(t, DummyOperator) and len(t.upstream_task_ids) == 1 and len(t.downstream_task_ids) == 1
+
+    keep = {t.task_id for t in dag.tasks if not pass_through(t)}
+
+    def resolve(task_id):
+        # follow a chain of pruned tasks until landing on a kept one
+        while task_id not in keep:
+            task_id = next(iter(dag.task_dict[task_id].downstream_task_ids))
+        return task_id
+
+    edges = set()
+    for task_id in keep:
+        for down in dag.task_dict[task_id].downstream_task_ids:
+            edges.add((task_id, resolve(down)))
+
+    return sorted(keep), sorted(edges)
+
+
+def build_dot(dag: "DAG", nodes: list, edges: list, title: str = None) -> str:
+    """Build minimal DOT source for the given nodes and edges
+
+    Args:
+        dag: DAG being rendered, used for the graph name
+        nodes: task ids to emit as nodes
+        edges: (upstream, downstream) task id pairs to emit as edges
+        title (optional): graph label (shown on top); defaults to None
+
+    Returns:
+        the DOT source
+    """
+    lines = [f'digraph "{dag.dag_id}" {{', "    rankdir=LR"]
+    if title:
+        # escape characters that would break out of the quoted attribute; task
+        # ids are safe, airflow restricts them to word chars, dots and dashes.
+        # labelloc=t keeps the title on top; graphviz defaults to the bottom
+        label = title.replace("\\", "\\\\").replace('"', '\\"')
+        lines += [f'    label="{label}"', "    labelloc=t"]
+    lines += [f'    "{n}"' for n in nodes]
+    lines += [f'    "{u}" -> "{v}"' for u, v in edges]
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def scan_module(module) -> tuple:
+    """Partition a module's members into DAGs and tasks in a single pass
+
+    Walking the module members is O(members) and used to happen once per DAG;
+    memoizing on the module object means it happens once per build no matter
+    how many DAGs (or tasks) the module holds.
+
+    Args:
+        module: the imported module being documented
+
+    Returns:
+        (dags, tasks_by_dag): list of :class:`airflow.DAG` found, and a dict
+        mapping each ``dag_id`` to its list of ``(name, task)`` members
+    """
+    from airflow import DAG
+    from airflow.models import BaseOperator
+
+    # vars() skips the analyzer/docstring machinery autodoc's
+    # get_module_members runs per member, which the type filter below doesn't
+    # need; __all__ is still respected when the module defines one
+    all_members = getattr(module, "__all__", None)
+
+    dags = []
+    tasks_by_dag = {}
+    for mbr_name, mbr in vars(module).items():
+        if mbr_name.startswith("_") or (all_members is not None and mbr_name not in all_members):
+            continue
+        if isinstance(mbr, BaseOperator) and mbr.dag is not None:
+            tasks_by_dag.setdefault(mbr.dag.dag_id, []).append((mbr_name, mbr))
+        elif isinstance(mbr, DAG):
+            dags.append(mbr)
+
+    return dags, tasks_by_dag
+
+
+def atomic_write(path: str, text: str) -> None:
+    """Write a file atomically
+
+    Writes to a per-process temp file and renames it onto `path`, so parallel
+    Sphinx workers (``sphinx-build -j auto``) can never observe (or clobber
+    each other with) a half-written file.
+
+    Args:
+        path: destination file path
+        text: file contents
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    Path(tmp).write_text(text)
+    os.replace(tmp, path)
+
+
 class DagTaskDocumenter(ClassDocumenter):
     """DagTaskDocumenter
 
@@ -70,26 +439,53 @@ class DagTaskDocumenter(ClassDocumenter):
 
     """
 
+    def import_object(self, raiseerror: bool = False) -> bool:
+        """Reuse the module already imported by the parent :class:`DagDocumenter`
+
+        Every task documented here is an attribute of the module the parent
+        :class:`DagDocumenter` has just imported; picking the object off that
+        module skips a redundant import per task. Falls back to the regular
+        autodoc import when no parent module is on the env.
+        """
+        module = self.env.temp_data.get("autodag:module")
+        if module is None or module.__name__ != self.modname:
+            return super().import_object(raiseerror)
+
+        self.module = self.parent = module
+        self.object_name = self.objpath[-1]
+        self.object = getattr(module, self.object_name)
+
+        # mirror what ClassDocumenter.import_object decides for objects that
+        # aren't classes: document them as attributes
+        if hasattr(self.object, "__name__"):
+            self.doc_as_attr = self.objpath[-1] != self.object.__name__
+        else:
+            self.doc_as_attr = True
+
+        return True
+
     def generate(self, *args, **kwargs):
         super(DagTaskDocumenter, self).generate(*args, **kwargs)
 
         sn = self.get_sourcename()
         op = self.object
 
-        # use doc_rst if available, otherwise try the auto_doc property
-        if hasattr(op, "doc_rst") and isinstance(op.doc_rst, str):
-            for i, l in enumerate(op.doc_rst.split("\n")):
-                self.add_line(l, sn, i)
-        if hasattr(op, "doc_md") and isinstance(op.doc_md, str):
-            for i, l in enumerate(m2r.convert(op.doc_md).split("\n")):
-                self.add_line(l, sn, i)
-        elif hasattr(op, "auto_doc") and isinstance(op.auto_doc, str):
-            self.add_line(" ", sn)
-            for i, l in enumerate(op.auto_doc.split("\n")):
-                self.add_line(l, sn, i)
-            self.add_line(" ", sn)
-
-        self.add_line(" ", sn)
+        # fetch each doc attribute once; getattr with a default avoids the
+        # try/except machinery hasattr runs per probe on BaseOperator
+        doc_rst = getattr(op, "doc_rst", None)
+        doc_md = getattr(op, "doc_md", None)
+        auto_doc = getattr(op, "auto_doc", None)
+
+        if isinstance(doc_rst, str):
+            add_text(self, doc_rst, sn)
+        if isinstance(doc_md, str):
+            add_text(self, md_to_rst(doc_md), sn)
+        if isinstance(auto_doc, str):
+            add_blank(self, sn)
+            add_text(self, auto_doc, sn)
+            add_blank(self, sn)
+
+        add_blank(self, sn)
         self.add_line(f":Operator: :class:`~{qual_name(op)}`", sn)
 
 
@@ -107,26 +503,26 @@ class DagDocumenter(ModuleDocumenter):
 
     objtype = "dag"
     directivetype = "module"
-    optional_arguments = 5
+    optional_arguments = 6
     option_spec = {
         "hide_diagram": bool,  # default False
         "hide_tasks": bool,  # default False
         "hide_schedule": bool,  # default False
+        # bool_option so the documented bare-flag form (":compact_diagram:")
+        # enables it; docutils hands bare flags to the converter as None
+        "compact_diagram": bool_option,  # default False
         "title": str,  # defaults to None
         "caption": str,  # defaults to None
     }
 
-    def get_dag_tasks(self, dag: DAG) -> list:
+    def get_dag_tasks(self, dag: "DAG") -> list:
         """Get the DAG's tasks
 
         Returns:
             tasks: list of :class:`airflow.operators.BaseOperator` associated with the given `dag`
         """
 
-        tasks = []
-        for mbr_name, mbr in get_module_members(self.object):
-            if issubclass(type(mbr), BaseOperator) and mbr.dag == dag:
-                tasks.append((mbr_name, mbr))
+        tasks = scan_module(self.object)[1].get(dag.dag_id, [])
 
         if not len(tasks):
             logger.warning(f"Could not find a single task for DAG {dag.dag_id}")
@@ -143,10 +539,7 @@ class DagDocumenter(ModuleDocumenter):
             dags: list of :class:`airflow.DAG` found
         """
 
-        dags = []
-        for mbr_name, mbr in get_module_members(self.object):
-            if issubclass(type(mbr), DAG):
-                dags.append(mbr)
+        dags = scan_module(self.object)[0]
 
         if not len(dags):
             logger.warning(f"Could not find a single DAG in {self.env.docname}.rst")
@@ -165,12 +558,12 @@ class DagDocumenter(ModuleDocumenter):
         assert sep in allowed, f"Title separator must be one of `{allowed}`; instead received `{sep}`"
 
         sn = self.get_sourcename()
-        self.add_line(" ", sn)
+        add_blank(self, sn)
         self.add_line(title, sn)
         self.add_line(sep * len(title), sn)
-        self.add_line(" ", sn)
+        add_blank(self, sn)
 
-    def add_schedule(self, dag: DAG, title="Schedule interval") -> None:
+    def add_schedule(self, dag: "DAG", title="Schedule interval") -> None:
         """Adds a section for the DAG's schedule
 
         DAG's schedule section formatted like::
@@ -184,14 +577,20 @@ class DagDocumenter(ModuleDocumenter):
                 "Schedule interval"
         """
         sn = self.get_sourcename()
+        si = dag.schedule_interval
 
+        add_blank(self, sn)
         self.add_line(title, sn)
-        if dag.schedule_interval is not None:
-            self.add_line(f"  {get_description(dag.schedule_interval)}", sn)
-        else:
+        if si is None:
             self.add_line(f"  None", sn)
+        elif isinstance(si, timedelta):
+            self.add_line(f"  Every {si}", sn)
+        elif si in PRESET_DESCRIPTIONS:
+            self.add_line(f"  {PRESET_DESCRIPTIONS[si]}", sn)
+        else:
+            self.add_line(f"  {describe_cron(si)}", sn)
 
-    def add_tasks(self, dag: DAG, title="Tasks") -> None:
+    def add_tasks(self, dag: "DAG", title="Tasks") -> None:
         """Adds a section for the DAG's tasks
 
         Will render :class:`DagTaskDocumenter` for each task of the given DAG.
@@ -210,51 +609,100 @@ class DagDocumenter(ModuleDocumenter):
 
             DagTaskDocumenter(self.directive, f"{self.fullname}.{t_name}").generate()
 
-    def add_diagram(self, dag: DAG, heading="Diagram", title=None, caption=None) -> None:
-        """Adds a Graphiz diagram of the DAG
+    def render_diagram(self, dag: "DAG", static_dir: str, title=None, compact=False) -> str:
+        """Renders the DAG's diagram to disk, unless already cached
 
         Will write a {dag.dag_id}.dot file to the html_static_path configured for this Sphinx
-        project; this file will then be referenced in a Graphviz directive.
+        project and pre-render it to {dag.dag_id}.svg with the ``dot`` executable. This method
+        only touches the filesystem and the env, so :meth:`generate` can safely run it on a
+        worker thread for each DAG in the module.
 
         .. seealso::
 
-            `Graphviz extension <https://www.sphinx-doc.org/en/master/usage/extensions/graphviz.html>`_
             `html_static_path <https://www.sphinx-doc.org/en/master/usage/configuration.html#confval-html_static_path>`_
 
         Args:
-            dag: DAG for which to add tasks
-            heading (optional): string used as header for section; defaults to "Diagram"
+            dag: DAG for which to render the diagram
+            static_dir: absolute path to the html_static_path directory the diagram is written to
             title (optional): diagram title; defaults to None (no title)
-            caption (optional) diagram caption (shown underneath diagram); defaults to None
+            compact (optional): whether to prune pass-through dummy tasks, see
+                :func:`compact_structure`; defaults to False
+
+        Returns:
+            svg_out: path to the rendered SVG
         """
 
-        sn = self.get_sourcename()
+        graph_out = f"{static_dir}/{dag.dag_id}.dot"
+        svg_out = f"{static_dir}/{dag.dag_id}.svg"
+
+        # skip the (expensive) render when the on-disk diagram already matches
+        # the structure that would be rendered - with compact set, that's the
+        # pruned structure, so swapping a pruned dummy task for a real operator
+        # invalidates the cache; the env (pickled across builds, see merge_dags
+        # and purge_dags) is consulted first, then the sidecar next to the .dot
+        nodes, edges = compact_structure(dag) if compact else dag_structure(dag)
+        current_hash = diagram_hash(nodes, edges, (title, compact))
+        hash_out = f"{graph_out}.sha"
+
+        cached = getattr(self.env, "autodag_dags", {}).get(self.env.docname, {}).get(dag.dag_id) == current_hash
+        if not cached:
+            try:
+                cached = Path(hash_out).read_text() == current_hash
+            except OSError:
+                cached = False
+
+        if cached and os.path.exists(svg_out):
+            logger.info(f"Diagram for {dag.dag_id} unchanged, skipping render")
+        else:
+            logger.info(f"Writing to {graph_out}")
 
-        static = self.env.config.html_static_path[0]
+            atomic_write(graph_out, build_dot(dag, nodes, edges, title=title))
 
-        # path to rst that calls autodag
-        caller = f"{self.env.doc2path(self.env.docname)}"
+            # pre-rasterize to SVG here so sphinx.ext.graphviz doesn't have to
+            # spawn a dot process per page on every build
+            tmp = f"{svg_out}.{os.getpid()}.tmp"
+            subprocess.run(["dot", "-Tsvg", "-o", tmp, graph_out], check=True)
+            os.replace(tmp, svg_out)
 
-        graph_out = f"{self.env.srcdir}/{static}/{dag.dag_id}.dot"
+            atomic_write(hash_out, current_hash)
 
-        logger.info(f"Writing to {graph_out}")
+        # record which doc emitted which diagram so parallel workers can merge
+        # their state back into the main env (see merge_dags/purge_dags)
+        if not hasattr(self.env, "autodag_dags"):
+            self.env.autodag_dags = {}
+        self.env.autodag_dags.setdefault(self.env.docname, {})[dag.dag_id] = current_hash
 
-        dot = render_dag(dag)
-        # label automatically defaults to dag_id
-        dot.graph_attr["label"] = title
-        dot.save(graph_out)
+        return svg_out
 
-        self.add_line(heading, sn)
-        self.add_line(f"  .. graphviz:: {os.path.relpath(graph_out, Path(caller).parent)}", sn)
+    def add_diagram(self, dag: "DAG", svg_out: str, caller_dir: Path, heading="Diagram", caption=None) -> None:
+        """Adds an image (or figure, when a caption is given) directive referencing the DAG's diagram
+
+        Args:
+            dag: DAG whose diagram is referenced
+            svg_out: path to the rendered SVG, return value of :meth:`render_diagram`
+            caller_dir: directory of the rst that calls autodag, used to reference the diagram
+            heading (optional): string used as header for section; defaults to "Diagram"
+            caption (optional) diagram caption (shown underneath diagram); defaults to None
+        """
+        sn = self.get_sourcename()
+
+        rel_svg = os.path.relpath(svg_out, caller_dir)
 
+        add_blank(self, sn)
+        self.add_line(heading, sn)
         if caption:
-            self.add_line(f"    :caption: {caption}", sn)
+            self.add_line(f"  .. figure:: {rel_svg}", sn)
+            self.add_line("", sn)
+            self.add_line(f"    {caption}", sn)
+        else:
+            self.add_line(f"  .. image:: {rel_svg}", sn)
 
     def add_md_docstring(self, md: list) -> None:
         """Add module's docstring
 
         DAGs only support markdown docstring; so we use this to convert it to rst,
-        and submit that as the actual docstring
+        and submit that as the actual docstring. Docstrings that already look
+        like rst (see :func:`looks_like_markdown`) are passed through as-is.
 
         Also adds a python module domain so that the dag can be referenced like::
 
@@ -266,37 +714,84 @@ class DagDocumenter(ModuleDocumenter):
         sn = self.get_sourcename()
 
         self.add_line(f".. py:module:: {self.fullname}", sn)
-        self.add_line("", sn)
+        add_blank(self, sn)
 
         if len(md):
-            doc_string = m2r.convert("\n".join(md[0]))
+            doc_string = "\n".join(md[0])
 
-            self.add_line("", sn)
-            for line in doc_string.split("\n"):
-                self.add_line(line, sn)
+            # docstrings that are already rst skip the markdown conversion
+            if looks_like_markdown(doc_string):
+                doc_string = md_to_rst(doc_string)
+
+            add_blank(self, sn)
+            add_text(self, doc_string, sn)
 
     def generate(self, *args, **kwargs):
 
         self.parse_name()
         self.import_object()
 
-        self.add_md_docstring(self.get_doc())
+        # share the imported module with the DagTaskDocumenters spawned by
+        # add_tasks so they don't each re-import it
+        self.env.temp_data["autodag:module"] = self.object
+
+        try:
+            self.add_md_docstring(self.get_doc())
+
+            # identical for every DAG in the module, so computed once; caller_dir
+            # is the directory of the rst that calls autodag
+            static_dir = f"{self.env.srcdir}/{self.env.config.html_static_path[0]}"
+            caller_dir = Path(self.env.doc2path(self.env.docname)).parent
+
+            hide_diagram = self.options.get("hide_diagram", False)
+            title = self.options.get("title", None)
+            compact = self.options.get("compact_diagram", False)
+
+            # are multiple DAGs even allowed per file?
+            dags = self.get_dags()
+
+            # the DOT build is cheap but the `dot` subprocess is not; render the
+            # diagrams concurrently when the module holds more than one DAG (the
+            # subprocess releases the GIL, so threads suffice)
+            svgs = {}
+            if not hide_diagram:
+                if len(dags) > 1:
+                    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                        futures = {dag.dag_id: pool.submit(self.render_diagram, dag, static_dir, title, compact) for dag in dags}
+                    svgs = {dag_id: future.result() for dag_id, future in futures.items()}
+                else:
+                    svgs = {dag.dag_id: self.render_diagram(dag, static_dir, title, compact) for dag in dags}
+
+            for dag in dags:
+                if not hide_diagram:
+                    self.add_diagram(dag, svgs[dag.dag_id], caller_dir, caption=self.options.get("caption", None))
+                if not self.options.get("hide_schedule", False):
+                    self.add_schedule(dag)
+
+                if not self.options.get("hide_tasks", False):
+                    self.add_tasks(dag)
+        finally:
+            self.env.temp_data.pop("autodag:module", None)
+
+
+def purge_dags(app, env, docname) -> None:
+    """Drop the diagram state recorded for a document that is being re-read"""
+    if hasattr(env, "autodag_dags"):
+        env.autodag_dags.pop(docname, None)
 
-        # are multiple DAGs even allowed per file?
-        for dag in self.get_dags():
-            if not self.options.get("hide_diagram", False):
-                self.add_diagram(
-                    dag, title=self.options.get("title", None), caption=self.options.get("caption", None)
-                )
-            if not self.options.get("hide_schedule", False):
-                self.add_schedule(dag)
 
-            if not self.options.get("hide_tasks", False):
-                self.add_tasks(dag)
+def merge_dags(app, env, docnames, other) -> None:
+    """Merge diagram state from a parallel worker's env into the main env"""
+    if not hasattr(env, "autodag_dags"):
+        env.autodag_dags = {}
+    for docname, dags in getattr(other, "autodag_dags", {}).items():
+        env.autodag_dags[docname] = dags
 
 
 def setup(app):
     app.add_autodocumenter(DagDocumenter)
+    app.connect("env-purge-doc", purge_dags)
+    app.connect("env-merge-info", merge_dags)
 
     return {
         "version": "0.1",
@@ -41,7 +41,6 @@ extensions = [
     "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
     "sphinx.ext.intersphinx",
-    "sphinx.ext.graphviz",
     "dags",  # see source/_ext/dags.py
 ]
 
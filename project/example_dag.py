@@ -14,9 +14,10 @@ You can use any markdown here:
 | Header      | Title       |
 | Paragraph   | Text        |
 
-This docstring gets converted to restructured text using the [m2r](https://pypi.org/project/m2r/) library.
+This docstring gets converted to restructured text using the
+[markdown-it-py](https://pypi.org/project/markdown-it-py/) library.
 
-Just below this docstring you'll find a dot diagram which represents the actual DAG (by default rendered as PNG)
+Just below this docstring you'll find a dot diagram which represents the actual DAG (rendered as SVG)
 as well as a human-readable version of the DAG's schedule interval.
 """
 